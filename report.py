@@ -1,10 +1,16 @@
 import streamlit as st
 import pandas as pd
-import json
-import plotly.express as px
+import numpy as np
+import orjson
 import plotly.graph_objects as go
+from pandas.api.types import is_datetime64_any_dtype
 from datetime import datetime
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # Set page config
 st.set_page_config(
     page_title="GitHub Copilot Analytics Dashboard",
@@ -22,129 +28,221 @@ This dashboard provides insights into GitHub Copilot usage metrics including:
 - Language-specific metrics
 """)
 
+# Columns kept from the flattened payloads, with the defaults used when a key is missing
+SUMMARY_COLUMNS = {
+    'total_active_users': 0,
+    'total_engaged_users': 0,
+    'copilot_ide_chat.total_engaged_users': 0,
+    'copilot_ide_code_completions.total_engaged_users': 0,
+    'copilot_dotcom_chat.total_engaged_users': 0,
+    'copilot_dotcom_pull_requests.total_engaged_users': 0
+}
+
+IDE_CHAT_COLUMNS = {
+    'is_custom_model': False,
+    'total_chats': 0,
+    'total_engaged_users': 0,
+    'total_chat_copy_events': 0,
+    'total_chat_insertion_events': 0
+}
+
+CODE_COMPLETION_COLUMNS = {
+    'is_custom_model': False,
+    'total_engaged_users': 0,
+    'total_code_acceptances': 0,
+    'total_code_suggestions': 0,
+    'total_code_lines_accepted': 0,
+    'total_code_lines_suggested': 0
+}
+
+# String keys stored as categoricals over Arrow strings so groupbys work on integer codes
+CATEGORY_COLUMNS = ['editor', 'model', 'language']
+
+DAYS_OF_WEEK = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+def parse_dates(dates):
+    # Dates are parsed once while flattening; everything downstream gets datetime64 columns
+    if is_datetime64_any_dtype(dates):
+        return dates
+    return pd.to_datetime(dates, format='ISO8601', cache=True)
+
+def column_types(defaults):
+    return {column: type(default) for column, default in defaults.items()}
+
+def fill_defaults(frame, defaults):
+    # Opt in to pandas' future fillna behaviour and infer the filled dtypes explicitly
+    with pd.option_context('future.no_silent_downcasting', True):
+        frame = frame.fillna(defaults).infer_objects(copy=False)
+    return frame.astype(column_types(defaults))
+
+def downcast_counts(frame, defaults):
+    # Counts are small non-negative integers, so narrow them to the smallest unsigned dtype
+    # and store them in Arrow buffers (uint8[pyarrow] etc.) for the groupby/sum kernels
+    for column, default in defaults.items():
+        if type(default) is int:
+            counts = pd.to_numeric(frame[column], downcast='unsigned')
+            frame[column] = counts.convert_dtypes(dtype_backend='pyarrow')
+    return frame
+
+def fill_missing_lists(records, path):
+    # json_normalize raises KeyError on a missing record path, so default nested lists to []
+    for record in records:
+        if record.get(path[0]) is None:
+            record[path[0]] = []
+        if len(path) > 1:
+            fill_missing_lists(record[path[0]], path[1:])
+
+def normalize_section(data, section, record_path, meta, renames, defaults):
+    # json_normalize needs every entry to carry the record path, so skip days without editors
+    entries = [entry for entry in data if entry.get(section, {}).get('editors')]
+    fill_missing_lists([entry[section] for entry in entries], record_path)
+    columns = list(dict.fromkeys(['date', *renames.values(), *defaults]))
+    if entries:
+        section_df = pd.json_normalize(entries, record_path=[section, *record_path],
+                                       meta=['date', *([section, *path] for path in meta)],
+                                       errors='ignore')
+    else:
+        section_df = pd.DataFrame()
+
+    section_df = section_df.rename(columns=renames).reindex(columns=columns)
+    section_df = fill_defaults(section_df, defaults)
+    section_df = downcast_counts(section_df, defaults)
+    key_columns = [column for column in CATEGORY_COLUMNS if column in columns]
+    section_df = section_df.astype(dict.fromkeys(key_columns, 'string[pyarrow]'))
+    section_df = section_df.astype(dict.fromkeys(key_columns, 'category'))
+    section_df['date'] = parse_dates(section_df['date'])
+    return section_df.sort_values('date', kind='stable', ignore_index=True)
+
 # Function to process the data
 def flatten_data(data):
-    rows = []
-    ide_chat_data = []
-    code_completion_data = []
-    for entry in data:
-        date = pd.to_datetime(entry.get('date'))
-        total_active_users = entry.get('total_active_users', 0)
-        total_engaged_users = entry.get('total_engaged_users', 0)
-        
-        # IDE Chat
-        ide_chat = entry.get('copilot_ide_chat', {})
-        for editor in ide_chat.get('editors', []):
-            editor_name = editor.get('name')
-            for model in editor.get('models', []):
-                ide_chat_data.append({
-                    'date': date,
-                    'editor': editor_name,
-                    'model': model.get('name'),
-                    'is_custom_model': model.get('is_custom_model', False),
-                    'total_chats': model.get('total_chats', 0),
-                    'total_engaged_users': model.get('total_engaged_users', 0),
-                    'total_chat_copy_events': model.get('total_chat_copy_events', 0),
-                    'total_chat_insertion_events': model.get('total_chat_insertion_events', 0)
-                })
-
-        # IDE Code Completions
-        ide_code = entry.get('copilot_ide_code_completions', {})
-        for editor in ide_code.get('editors', []):
-            editor_name = editor.get('name')
-            for model in editor.get('models', []):
-                model_name = model.get('name')
-                is_custom_model = model.get('is_custom_model', False)
-                for lang in model.get('languages', []):
-                    code_completion_data.append({
-                        'date': date,
-                        'editor': editor_name,
-                        'model': model_name,
-                        'is_custom_model': is_custom_model,
-                        'language': lang.get('name'),
-                        'total_engaged_users': lang.get('total_engaged_users', 0),
-                        'total_code_acceptances': lang.get('total_code_acceptances', 0),
-                        'total_code_suggestions': lang.get('total_code_suggestions', 0),
-                        'total_code_lines_accepted': lang.get('total_code_lines_accepted', 0),
-                        'total_code_lines_suggested': lang.get('total_code_lines_suggested', 0)
-                    })
-
-        rows.append({
-            'date': date,
-            'total_active_users': total_active_users,
-            'total_engaged_users': total_engaged_users,
-            'copilot_ide_chat.total_engaged_users': ide_chat.get('total_engaged_users', 0),
-            'copilot_ide_code_completions.total_engaged_users': ide_code.get('total_engaged_users', 0),
-            'copilot_dotcom_chat.total_engaged_users': entry.get('copilot_dotcom_chat', {}).get('total_engaged_users', 0),
-            'copilot_dotcom_pull_requests.total_engaged_users': entry.get('copilot_dotcom_pull_requests', {}).get('total_engaged_users', 0)
-        })
-
-    df = pd.DataFrame(rows)
-    ide_chat_df = pd.DataFrame(ide_chat_data)
-    code_completion_df = pd.DataFrame(code_completion_data)
+    # IDE Chat
+    ide_chat_df = normalize_section(
+        data, 'copilot_ide_chat',
+        record_path=['editors', 'models'],
+        meta=[['editors', 'name']],
+        renames={'copilot_ide_chat.editors.name': 'editor', 'name': 'model'},
+        defaults=IDE_CHAT_COLUMNS
+    )
+
+    # IDE Code Completions
+    code_completion_df = normalize_section(
+        data, 'copilot_ide_code_completions',
+        record_path=['editors', 'models', 'languages'],
+        meta=[['editors', 'name'], ['editors', 'models', 'name'], ['editors', 'models', 'is_custom_model']],
+        renames={
+            'copilot_ide_code_completions.editors.name': 'editor',
+            'copilot_ide_code_completions.editors.models.name': 'model',
+            'copilot_ide_code_completions.editors.models.is_custom_model': 'is_custom_model',
+            'name': 'language'
+        },
+        defaults=CODE_COMPLETION_COLUMNS
+    )
+
+    # Daily summary
+    df = pd.json_normalize(data).reindex(columns=['date', *SUMMARY_COLUMNS])
+    df = fill_defaults(df, SUMMARY_COLUMNS)
+    df = downcast_counts(df, SUMMARY_COLUMNS)
+    df['date'] = parse_dates(df['date'])
+    df = df.sort_values('date', kind='stable', ignore_index=True)
     return df, ide_chat_df, code_completion_df
 
-def process_data(data):
+@st.cache_data(show_spinner=False)
+def process_data(json_input):
+    data = orjson.loads(json_input)
     return flatten_data(data)
 
+def hash_input(json_input):
+    # Cheap fingerprint for the session-state check, so unchanged input skips the process_data call
+    # (and its md5 cache-key hashing) on reruns; fall back to the builtin hash
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(json_input.encode())
+    return hash(json_input)
+
+def hash_dataframe(df):
+    # Ordered row hashes plus column names and dtypes, so reordered or relabelled frames get their own key
+    return (tuple(df.columns), tuple(map(str, df.dtypes)),
+            pd.util.hash_pandas_object(df).to_numpy().tobytes())
+
+def aggregate_languages(code_completion_df):
+    # Shared by the language charts and the Code Completion Metrics tab
+    return code_completion_df.groupby('language', observed=True).agg({
+        'total_code_suggestions': 'sum',
+        'total_code_acceptances': 'sum',
+        'total_code_lines_suggested': 'sum',
+        'total_code_lines_accepted': 'sum'
+    }).reset_index()
+
+def filter_dates(frame, start_date, end_date):
+    # Frames come out of flatten_data sorted by date, so the range is a contiguous slice
+    lo = frame['date'].searchsorted(start_date, side='left')
+    hi = frame['date'].searchsorted(end_date, side='right')
+    return frame.iloc[lo:hi]
+
+def add_total_row(metrics, label_column):
+    # Build the TOTAL row from the column sums' own Arrow dtype; enlarging with .loc would
+    # fall back to double for uint64[pyarrow] columns
+    totals = metrics.drop(columns=label_column).sum().to_frame().T
+    totals.insert(0, label_column, 'TOTAL')
+    return pd.concat([metrics, totals], ignore_index=True)
+
 # Function to create visualizations
-def create_visualizations(df, ide_chat_df, code_completion_df):
-    # Ensure 'date' columns are datetime
-    if 'date' in df.columns:
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-    if 'date' in ide_chat_df.columns:
-        ide_chat_df['date'] = pd.to_datetime(ide_chat_df['date'], errors='coerce')
-    if 'date' in code_completion_df.columns:
-        code_completion_df['date'] = pd.to_datetime(code_completion_df['date'], errors='coerce')
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: hash_dataframe})
+def create_visualizations(df, ide_chat_df, language_metrics):
+    dates = df['date'].to_numpy()
 
     # 1. Daily Active Users
-    fig_users = px.line(df, x='date', y='total_active_users',
-                       title='Daily Active Users',
-                       labels={'date': 'Date', 'total_active_users': 'Active Users'})
+    fig_users = go.Figure(go.Scatter(x=dates, y=df['total_active_users'].to_numpy(), mode='lines'))
+    fig_users.update_layout(title='Daily Active Users', xaxis_title='Date', yaxis_title='Active Users')
 
     # 2. IDE Chat Usage by Editor
-    fig_ide_chat = px.bar(ide_chat_df.groupby(['date', 'editor'])['total_chats'].sum().reset_index(),
-                         x='date', y='total_chats', color='editor',
-                         title='IDE Chat Usage by Editor',
-                         labels={'date': 'Date', 'total_chats': 'Total Chats', 'editor': 'Editor'})
+    chats_by_editor = (ide_chat_df.groupby(['date', 'editor'], observed=True)['total_chats'].sum()
+                       .unstack('editor', fill_value=0))
+    fig_ide_chat = go.Figure([
+        go.Bar(x=chats_by_editor.index.to_numpy(), y=chats.to_numpy(), name=str(editor))
+        for editor, chats in chats_by_editor.items()
+    ])
+    fig_ide_chat.update_layout(title='IDE Chat Usage by Editor', xaxis_title='Date', yaxis_title='Total Chats',
+                               legend_title='Editor', barmode='relative')
 
     # 3. Code Completion Metrics by Language
-    fig_code_completion = px.bar(code_completion_df.groupby('language')['total_code_suggestions'].sum().reset_index(),
-                               x='language', y='total_code_suggestions',
-                               title='Total Code Suggestions by Language',
-                               labels={'language': 'Language', 'total_code_suggestions': 'Total Suggestions'})
+    languages = language_metrics['language'].to_numpy()
+    fig_code_completion = go.Figure(go.Bar(x=languages, y=language_metrics['total_code_suggestions'].to_numpy()))
+    fig_code_completion.update_layout(title='Total Code Suggestions by Language',
+                                      xaxis_title='Language', yaxis_title='Total Suggestions')
 
     # 4. Code Acceptance Rate
-    code_completion_df['acceptance_rate'] = (code_completion_df['total_code_acceptances'] /
-                                           code_completion_df['total_code_suggestions'] * 100)
-    fig_acceptance = px.bar(code_completion_df.groupby('language')['acceptance_rate'].mean().reset_index(),
-                          x='language', y='acceptance_rate',
-                          title='Code Acceptance Rate by Language (%)',
-                          labels={'language': 'Language', 'acceptance_rate': 'Acceptance Rate (%)'})
+    acceptance_rate = (language_metrics['total_code_acceptances'].to_numpy() /
+                       language_metrics['total_code_suggestions'].to_numpy() * 100)
+    fig_acceptance = go.Figure(go.Bar(x=languages, y=acceptance_rate))
+    fig_acceptance.update_layout(title='Code Acceptance Rate by Language (%)',
+                                 xaxis_title='Language', yaxis_title='Acceptance Rate (%)')
 
     # 5. User Engagement Over Time
-    fig_engagement = px.line(df, x='date', 
-                           y=['total_active_users', 'total_engaged_users',
-                              'copilot_ide_chat.total_engaged_users',
-                              'copilot_ide_code_completions.total_engaged_users',
-                              'copilot_dotcom_chat.total_engaged_users',
-                              'copilot_dotcom_pull_requests.total_engaged_users'],
-                           title='User Engagement Over Time',
-                           labels={'date': 'Date', 'value': 'Number of Users', 'variable': 'User Type'})
+    fig_engagement = go.Figure([
+        go.Scatter(x=dates, y=df[column].to_numpy(), mode='lines', name=column)
+        for column in ['total_active_users', 'total_engaged_users',
+                       'copilot_ide_chat.total_engaged_users',
+                       'copilot_ide_code_completions.total_engaged_users',
+                       'copilot_dotcom_chat.total_engaged_users',
+                       'copilot_dotcom_pull_requests.total_engaged_users']
+    ])
+    fig_engagement.update_layout(title='User Engagement Over Time', xaxis_title='Date',
+                                 yaxis_title='Number of Users', legend_title='User Type')
 
     # 6. Daily Usage Heatmap
-    df['day_of_week'] = df['date'].dt.day_name()
-    df['hour'] = df['date'].dt.hour
-    usage_heatmap = df.pivot_table(
-        values='total_active_users',
-        index='day_of_week',
-        columns='hour',
-        aggfunc='mean'
-    ).fillna(0)
+    cells = (df['date'].dt.dayofweek.to_numpy(), df['date'].dt.hour.to_numpy())
+    activity_sum = np.zeros((len(DAYS_OF_WEEK), 24))
+    activity_count = np.zeros((len(DAYS_OF_WEEK), 24))
+    np.add.at(activity_sum, cells, df['total_active_users'].to_numpy())
+    np.add.at(activity_count, cells, 1)
+    usage_heatmap = np.divide(activity_sum, activity_count,
+                              out=np.zeros_like(activity_sum), where=activity_count > 0)
     
-    fig_heatmap = px.imshow(usage_heatmap,
-                           title='Average User Activity by Day and Hour',
-                           labels={'x': 'Hour of Day', 'y': 'Day of Week', 'color': 'Active Users'})
+    fig_heatmap = go.Figure(go.Heatmap(z=usage_heatmap, x=list(range(24)), y=DAYS_OF_WEEK,
+                                       colorbar={'title': 'Active Users'}))
+    fig_heatmap.update_layout(title='Average User Activity by Day and Hour',
+                              xaxis_title='Hour of Day', yaxis_title='Day of Week',
+                              yaxis_autorange='reversed')
     
     return fig_users, fig_ide_chat, fig_code_completion, fig_acceptance, fig_engagement, fig_heatmap
 
@@ -157,24 +255,21 @@ def main():
     st.sidebar.subheader("Usage Data")
     json_input = st.sidebar.text_area("Paste your usage JSON data here:", height=200)
     
-    # Default data
-    default_data = [
-        # Your provided JSON data here
-    ]
+    # Nothing to process until usage data has been pasted
+    if not json_input.strip():
+        st.info("Please paste your usage JSON data in the sidebar to begin.")
+        st.stop()
     
     try:
-        # Process usage data
-        if json_input:
-            data = json.loads(json_input)
-        else:
-            data = default_data
-            
-        # Process data
-        df, ide_chat_df, code_completion_df = process_data(data)
+        # Process usage data, reusing the previous run's frames while the pasted text is unchanged
+        json_hash = hash_input(json_input)
+        if st.session_state.get('json_hash') != json_hash:
+            st.session_state['usage_data'] = process_data(json_input)
+            st.session_state['json_hash'] = json_hash
+        df, ide_chat_df, code_completion_df = st.session_state['usage_data']
         
         # Add date filters in sidebar
         st.sidebar.subheader("Date Range Filter")
-        df['date'] = pd.to_datetime(df['date'])
         min_date = df['date'].min().date()
         max_date = df['date'].max().date()
         
@@ -192,65 +287,70 @@ def main():
             max_value=max_date
         )
         
-        # Convert date inputs to datetime
-        start_date = pd.to_datetime(start_date)
-        end_date = pd.to_datetime(end_date)
-        
-        # Convert string dates to datetime in dataframes if they aren't already
-        df['date'] = pd.to_datetime(df['date'])
-        ide_chat_df['date'] = pd.to_datetime(ide_chat_df['date'])
-        code_completion_df['date'] = pd.to_datetime(code_completion_df['date'])
-        
         # Convert input dates to datetime64[ns] for comparison
         start_date = pd.Timestamp(start_date)
         end_date = pd.Timestamp(end_date)
         
         # Filter data based on date range
-        df = df[(df['date'] >= start_date) & (df['date'] <= end_date)]
-        ide_chat_df = ide_chat_df[(ide_chat_df['date'] >= start_date) & (ide_chat_df['date'] <= end_date)]
-        code_completion_df = code_completion_df[(code_completion_df['date'] >= start_date) & (code_completion_df['date'] <= end_date)]
+        df = filter_dates(df, start_date, end_date)
+        ide_chat_df = filter_dates(ide_chat_df, start_date, end_date)
+        code_completion_df = filter_dates(code_completion_df, start_date, end_date)
+        
+        # Aggregate code completions per language once for the charts and the metrics tab
+        language_metrics = aggregate_languages(code_completion_df)
         
         # Create visualizations
         fig_users, fig_ide_chat, fig_code_completion, fig_acceptance, fig_engagement, fig_heatmap = create_visualizations(
-            df, ide_chat_df, code_completion_df
+            df, ide_chat_df, language_metrics
         )
         
         # Display date range
         st.subheader(f"Data from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
         
+        # Column totals computed once and shared by the metrics below
+        usage_stats = df.drop(columns='date').agg(['sum', 'max'])
+        usage_totals = usage_stats.loc['sum']
+        # First and last day's engagement rate for the delta, from one two-row slice
+        end_days = df.iloc[[0, -1]]
+        end_rates = (end_days['total_engaged_users'] / end_days['total_active_users']).to_numpy()
+        total_chats = ide_chat_df['total_chats'].sum()
+        completion_totals = code_completion_df[['total_code_suggestions', 'total_code_acceptances']].sum()
+        total_active_users = usage_totals['total_active_users']
+        average_active_users = total_active_users / len(df) if len(df) else float('nan')
+        
         # Display metrics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Active Users", df['total_active_users'].sum())
+            st.metric("Total Active Users", total_active_users)
         with col2:
-            st.metric("Total IDE Chats", ide_chat_df['total_chats'].sum())
+            st.metric("Total IDE Chats", total_chats)
         with col3:
-            st.metric("Total Code Suggestions", code_completion_df['total_code_suggestions'].sum())
+            st.metric("Total Code Suggestions", completion_totals['total_code_suggestions'])
         with col4:
-            st.metric("Total Code Acceptances", code_completion_df['total_code_acceptances'].sum())
+            st.metric("Total Code Acceptances", completion_totals['total_code_acceptances'])
         
         # User Statistics Section
         st.subheader("User Statistics")
         user_col1, user_col2, user_col3 = st.columns(3)
         
         with user_col1:
-            st.metric("Average Daily Active Users", round(df['total_active_users'].mean(), 2))
-            st.metric("Peak Active Users", df['total_active_users'].max())
-            st.metric("Total Unique Engaged Users", df['total_engaged_users'].sum())
+            st.metric("Average Daily Active Users", round(average_active_users, 2))
+            st.metric("Peak Active Users", usage_stats.at['max', 'total_active_users'])
+            st.metric("Total Unique Engaged Users", usage_totals['total_engaged_users'])
         
         with user_col2:
             st.metric("Average Daily Engagement Rate", 
-                     round((df['total_engaged_users'].sum() / df['total_active_users'].sum()) * 100, 2),
-                     delta=f"{round((df['total_engaged_users'].iloc[-1] / df['total_active_users'].iloc[-1] - df['total_engaged_users'].iloc[0] / df['total_active_users'].iloc[0]) * 100, 2)}%")
+                     round((usage_totals['total_engaged_users'] / total_active_users) * 100, 2),
+                     delta=f"{round((end_rates[-1] - end_rates[0]) * 100, 2)}%")
             st.metric("Average Chats per User", 
-                     round(ide_chat_df['total_chats'].sum() / df['total_active_users'].sum(), 2))
+                     round(total_chats / total_active_users, 2))
             st.metric("Average Code Acceptances per User",
-                     round(code_completion_df['total_code_acceptances'].sum() / df['total_active_users'].sum(), 2))
+                     round(completion_totals['total_code_acceptances'] / total_active_users, 2))
         
         with user_col3:
-            st.metric("GitHub.com Chat Users", df['copilot_dotcom_chat.total_engaged_users'].sum())
-            st.metric("GitHub.com PR Users", df['copilot_dotcom_pull_requests.total_engaged_users'].sum())
-            engagement_ratio = round((df['copilot_ide_chat.total_engaged_users'].sum() / df['total_engaged_users'].sum()) * 100, 2)
+            st.metric("GitHub.com Chat Users", usage_totals['copilot_dotcom_chat.total_engaged_users'])
+            st.metric("GitHub.com PR Users", usage_totals['copilot_dotcom_pull_requests.total_engaged_users'])
+            engagement_ratio = round((usage_totals['copilot_ide_chat.total_engaged_users'] / usage_totals['total_engaged_users']) * 100, 2)
             st.metric("IDE Chat Engagement Ratio", f"{engagement_ratio}%")
         
         # Display visualizations
@@ -274,7 +374,7 @@ def main():
         
         with tab1:
             # Calculate IDE Chat metrics with totals
-            ide_chat_metrics = ide_chat_df.groupby('editor').agg({
+            ide_chat_metrics = ide_chat_df.groupby('editor', observed=True).agg({
                 'total_chats': 'sum',
                 'total_engaged_users': 'sum',
                 'total_chat_copy_events': 'sum',
@@ -282,38 +382,12 @@ def main():
             }).reset_index()
             
             # Add total row
-            total_row = pd.DataFrame([{
-                'editor': 'TOTAL',
-                'total_chats': ide_chat_metrics['total_chats'].sum(),
-                'total_engaged_users': ide_chat_metrics['total_engaged_users'].sum(),
-                'total_chat_copy_events': ide_chat_metrics['total_chat_copy_events'].sum(),
-                'total_chat_insertion_events': ide_chat_metrics['total_chat_insertion_events'].sum()
-            }])
-            
-            # Combine metrics with total row
-            ide_chat_metrics = pd.concat([ide_chat_metrics, total_row], ignore_index=True)
+            ide_chat_metrics = add_total_row(ide_chat_metrics, 'editor')
             st.dataframe(ide_chat_metrics)
         
         with tab2:
-            # Calculate Code Completion metrics with totals
-            code_completion_metrics = code_completion_df.groupby('language').agg({
-                'total_code_suggestions': 'sum',
-                'total_code_acceptances': 'sum',
-                'total_code_lines_suggested': 'sum',
-                'total_code_lines_accepted': 'sum'
-            }).reset_index()
-            
-            # Add total row
-            total_row = pd.DataFrame([{
-                'language': 'TOTAL',
-                'total_code_suggestions': code_completion_metrics['total_code_suggestions'].sum(),
-                'total_code_acceptances': code_completion_metrics['total_code_acceptances'].sum(),
-                'total_code_lines_suggested': code_completion_metrics['total_code_lines_suggested'].sum(),
-                'total_code_lines_accepted': code_completion_metrics['total_code_lines_accepted'].sum()
-            }])
-            
-            # Combine metrics with total row
-            code_completion_metrics = pd.concat([code_completion_metrics, total_row], ignore_index=True)
+            # Code Completion metrics with totals
+            code_completion_metrics = add_total_row(language_metrics, 'language')
             st.dataframe(code_completion_metrics)
             
         with tab3:
@@ -333,6 +407,9 @@ def main():
             
             st.dataframe(user_engagement_metrics)
             
+    except orjson.JSONDecodeError as e:
+        st.error(f"Invalid JSON format: {str(e)}")
+        st.info("Please check your JSON input format and try again.")
     except Exception as e:
         st.error(f"Error processing data: {str(e)}")
         st.info("Please check your JSON input format and try again.")
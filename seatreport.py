@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import json
+import plotly.graph_objects as go
+import orjson
+import warnings
 from datetime import datetime
-from dateutil import parser
+from pandas.api.types import is_datetime64_any_dtype
 
 # Set page config
 st.set_page_config(
@@ -19,11 +20,26 @@ This dashboard provides insights into seat allocation, usage, and team distribut
 Use the filters on the sidebar to analyze specific time periods and teams.
 """)
 
+def parse_timestamps(values):
+    # Keep the seats' own UTC offset; only normalise to UTC when seats carry different offsets
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        try:
+            parsed = pd.to_datetime(values, format='ISO8601', cache=True)
+        except ValueError:
+            parsed = None
+    if parsed is None or not is_datetime64_any_dtype(parsed):
+        parsed = pd.to_datetime(values, format='ISO8601', utc=True, cache=True)
+    return parsed
+
 # Load and process data
 @st.cache_data
-def process_data(json_data):
-    # Convert seats array to DataFrame
-    df = pd.DataFrame(json_data.get('seats', []))
+def process_data(json_input):
+    # Parse inside the cached function so unchanged input never rebuilds the nested dicts
+    json_data = orjson.loads(json_input)
+    
+    # Flatten seats array into a DataFrame, nested keys become e.g. assignee_login
+    df = pd.json_normalize(json_data.get('seats', []), sep='_')
     if df.empty:
         return df
     
@@ -31,24 +47,114 @@ def process_data(json_data):
     date_columns = ['created_at', 'updated_at', 'last_activity_at']
     for col in date_columns:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col])
+            df[col] = parse_timestamps(df[col])
     
-    # Extract team information
-    if 'assigning_team' in df.columns:
-        df['team_name'] = df['assigning_team'].apply(lambda x: x.get('name') if x else None)
-        df['team_id'] = df['assigning_team'].apply(lambda x: x.get('id') if x else None)
+    # Team and assignee information
+    df = df.rename(columns={
+        'assigning_team_name': 'team_name',
+        'assignee_login': 'user_login',
+        'assignee_type': 'user_type'
+    })
     
-    # Extract assignee information
-    if 'assignee' in df.columns:
-        df['user_login'] = df['assignee'].apply(lambda x: x.get('login') if x else None)
-        df['user_type'] = df['assignee'].apply(lambda x: x.get('type') if x else None)
-        df['user_id'] = df['assignee'].apply(lambda x: x.get('id') if x else None)
+    # Keep only the columns the dashboard reads so filtering and copies move less data
+    df = df.reindex(columns=[
+        'created_at',
+        'updated_at',
+        'last_activity_at',
+        'team_name',
+        'user_login',
+        'user_type',
+        'last_activity_editor',
+        'plan_type'
+    ])
+    
+    # Store strings in Arrow buffers; teams repeat across many seats, so they become a categorical
+    df = df.astype(dict.fromkeys(['team_name', 'user_login', 'user_type', 'last_activity_editor', 'plan_type'],
+                                 'string[pyarrow]'))
+    df['team_name'] = df['team_name'].astype('category')
     
     # Add total seats count from the root level
     df['total_available_seats'] = json_data.get('total_seats', 0)
     
     return df
 
+# Filter seats and compute the aggregated views
+@st.cache_data
+def compute_views(df, date_range, selected_team):
+    # Apply filters as one combined mask so the seats are copied only once
+    mask = pd.Series(True, index=df.index)
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        # Compare against timestamps in the column's timezone so the mask stays on datetime64 values
+        tz = df['created_at'].dt.tz
+        mask &= df['created_at'].between(
+            pd.Timestamp(start_date, tz=tz),
+            pd.Timestamp(end_date, tz=tz) + pd.Timedelta(days=1),
+            inclusive='left'
+        )
+
+    if selected_team != 'All Teams':
+        # Compare the categorical's integer codes rather than the team strings
+        team_code = df['team_name'].cat.categories.get_loc(selected_team)
+        mask &= df['team_name'].cat.codes.to_numpy() == team_code
+
+    filtered_df = df[mask]
+
+    # Active users per day
+    daily_activity = (
+        filtered_df.loc[filtered_df['last_activity_at'].notna(), ['last_activity_at']]
+        .set_index('last_activity_at').tz_localize(None)
+        .resample('D').size()
+        .rename_axis('date').reset_index(name='count')
+    )
+
+    # Team-wise summary
+    team_summary = filtered_df.assign(
+        is_active=filtered_df['last_activity_at'].notna()
+    ).groupby('team_name', sort=False, observed=True).agg(
+        total_users=('user_login', 'count'),
+        active_users=('is_active', 'sum'),
+        first_seat_created=('created_at', 'min')
+    ).reset_index()
+
+    team_summary.columns = ['Team', 'Total Users', 'Active Users', 'First Seat Created']
+    team_summary['Inactive Users'] = team_summary['Total Users'] - team_summary['Active Users']
+    team_summary['Active %'] = (team_summary['Active Users'] / team_summary['Total Users'] * 100).round(1)
+    team_summary['First Seat Created'] = team_summary['First Seat Created'].dt.date
+
+    # Sort by total users in descending order
+    team_summary = team_summary.sort_values('Total Users', ascending=False)
+
+    # Seats per team for the pie chart, taken from the summary instead of a second pass
+    team_counts = team_summary.set_index('Team')['Total Users']
+
+    return filtered_df, team_summary, daily_activity, team_counts
+
+@st.cache_resource(max_entries=32)
+def build_pie(team_counts):
+    fig_team = go.Figure(go.Pie(
+        values=team_counts.to_numpy(),
+        labels=team_counts.index.to_numpy(),
+        textposition='inside',
+        textinfo='percent+label'
+    ))
+    fig_team.update_layout(title="Seat Distribution by Team")
+    return fig_team
+
+@st.cache_resource(max_entries=32)
+def build_timeline(daily_activity):
+    fig_timeline = go.Figure(go.Scatter(
+        x=daily_activity['date'].to_numpy(),
+        y=daily_activity['count'].to_numpy(),
+        mode='lines+markers'
+    ))
+    fig_timeline.update_layout(title="Daily Active Users", xaxis_title='date', yaxis_title='count')
+    return fig_timeline
+
+@st.cache_data
+def to_csv_bytes(df):
+    return df.to_csv(index=False).encode()
+
 # Sidebar JSON input
 st.sidebar.header("Input Data")
 json_input = st.sidebar.text_area(
@@ -60,9 +166,8 @@ json_input = st.sidebar.text_area(
 # Process JSON input
 if json_input:
     try:
-        data = json.loads(json_input)
-        df = process_data(data)
-    except json.JSONDecodeError:
+        df = process_data(json_input)
+    except orjson.JSONDecodeError:
         st.error("Invalid JSON format. Please check your input.")
         st.stop()
     except Exception as e:
@@ -86,19 +191,16 @@ date_range = st.sidebar.date_input(
 )
 
 # Team filter
-all_teams = ['All Teams'] + sorted(df['team_name'].unique().tolist())
+# team_name is a categorical, so its categories are already the sorted distinct teams
+all_teams = ['All Teams'] + df['team_name'].cat.categories.tolist()
 selected_team = st.sidebar.selectbox("Select Team", all_teams)
 
-# Apply filters
-if len(date_range) == 2:
-    start_date, end_date = date_range
-    mask = (df['created_at'].dt.date >= start_date) & (df['created_at'].dt.date <= end_date)
-    filtered_df = df[mask]
-else:
-    filtered_df = df
-
-if selected_team != 'All Teams':
-    filtered_df = filtered_df[filtered_df['team_name'] == selected_team]
+# Apply filters, reusing the previous run's views while the input and filters are unchanged
+view_key = (hash(json_input), date_range, selected_team)
+if st.session_state.get('view_key') != view_key:
+    st.session_state['views'] = compute_views(df, date_range, selected_team)
+    st.session_state['view_key'] = view_key
+filtered_df, team_summary, daily_activity, team_counts = st.session_state['views']
 
 # Main content
 st.header("Overview")
@@ -127,44 +229,16 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Team Distribution")
-    team_counts = filtered_df['team_name'].value_counts()
-    fig_team = px.pie(
-        values=team_counts.values,
-        names=team_counts.index,
-        title="Seat Distribution by Team"
-    )
-    fig_team.update_traces(textposition='inside', textinfo='percent+label')
+    fig_team = build_pie(team_counts)
     st.plotly_chart(fig_team, use_container_width=True)
 
 with col2:
     st.subheader("Activity Timeline")
-    activity_data = filtered_df[filtered_df['last_activity_at'].notna()].copy()
-    activity_data['date'] = activity_data['last_activity_at'].dt.date
-    daily_activity = activity_data.groupby('date').size().reset_index(name='count')
-    fig_timeline = px.line(
-        daily_activity,
-        x='date',
-        y='count',
-        title="Daily Active Users"
-    )
-    fig_timeline.update_traces(mode='lines+markers')
+    fig_timeline = build_timeline(daily_activity)
     st.plotly_chart(fig_timeline, use_container_width=True)
 
 # Team-wise summary table
 st.subheader("Team-wise User Summary")
-team_summary = filtered_df.groupby('team_name').agg({
-    'user_login': 'count',
-    'last_activity_at': lambda x: x.notna().sum(),
-    'created_at': 'min'
-}).reset_index()
-
-team_summary.columns = ['Team', 'Total Users', 'Active Users', 'First Seat Created']
-team_summary['Inactive Users'] = team_summary['Total Users'] - team_summary['Active Users']
-team_summary['Active %'] = (team_summary['Active Users'] / team_summary['Total Users'] * 100).round(1)
-team_summary['First Seat Created'] = team_summary['First Seat Created'].dt.date
-
-# Sort by total users in descending order
-team_summary = team_summary.sort_values('Total Users', ascending=False)
 
 # Display the summary table
 st.dataframe(
@@ -211,11 +285,9 @@ st.dataframe(
 )
 
 # Export functionality
-if st.button("Export to CSV"):
-    csv = detailed_view.to_csv(index=False)
-    st.download_button(
-        label="Download CSV",
-        data=csv,
-        file_name="seat_report.csv",
-        mime="text/csv"
-    )
+st.download_button(
+    label="Export to CSV",
+    data=to_csv_bytes(detailed_view),
+    file_name="seat_report.csv",
+    mime="text/csv"
+)